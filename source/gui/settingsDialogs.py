@@ -5910,7 +5910,7 @@ def _isResponseAddonStoreCacheHash(response: requests.Response) -> bool:
 
 def _isResponseUpdateMetadata(response: requests.Response) -> bool:
 	try:
-		updateCheck.UpdateInfo.parseUpdateCheckResponse(response.text)
+		updateCheck.UpdateInfo.parseUpdateCheckResponse(response.content)
 	except Exception:
 		return False
 	return True
@@ -9,7 +9,6 @@
 """
 
 from collections.abc import Callable
-from datetime import datetime
 from typing import (
 	Any,
 	Dict,
@@ -39,15 +38,24 @@
 import sys  # noqa: E402
 import subprocess
 import os
+import functools
 import inspect
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import io
+import json
 import pickle
 
 # #9818: one must import at least urllib.request in Python 3 in order to use full urllib functionality.
 import urllib.request
 import urllib.parse
+import http.client
+import socket
 import hashlib
+import hmac
+import mmap
 import wx
 import languageHandler
 
@@ -65,9 +73,10 @@
 import addonAPIVersion
 from logHandler import log, isPathExternalToNVDA
 import winKernel
+from fileUtils import FaultTolerantFile
 from utils.networking import _fetchUrlAndUpdateRootCertificates
 from utils.tempFile import _createEmptyTempFileForDeletingFile
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
 
 import NVDAState
 
@@ -108,7 +117,26 @@ def __getattr__(attrName: str) -> Any:
 #: The time to wait before retrying a failed check.
 RETRY_INTERVAL = 600  # 10 min
 #: The download block size in bytes.
-DOWNLOAD_BLOCK_SIZE = 8192  # 8 kb
+DOWNLOAD_BLOCK_SIZE = 128 * 1024  # 128 KiB
+#: The hash algorithms supported for verifying a downloaded launcher, by digest size in bytes.
+#: Update servers should provide SHA-256 hashes, as SHA-1 is deprecated.
+_LAUNCHER_HASH_ALGORITHMS: dict[int, str] = {
+	20: "sha1",
+	32: "sha256",
+}
+#: The maximum number of connections used to download an update,
+#: when the server supports range requests.
+DOWNLOAD_CONNECTIONS = 4
+#: The minimum size in bytes of the part of an update downloaded over each connection.
+_MIN_DOWNLOAD_SEGMENT_SIZE = 4 * 1024 * 1024  # 4 MiB
+# #2352: Some security scanners such as Eset NOD32 HTTP Scanner
+# cause huge read delays while downloading.
+# Therefore, set a higher timeout.
+# The NVDA exe is about 35 MB.
+# The average download speed in the world is 0.5 MB/s
+# in some developing countries with the slowest internet.
+# This yields an expected download time of 10min on slower networks.
+_DOWNLOAD_TIMEOUT_S = 60 * 30  # 30 min
 
 #: directory to store pending update files
 storeUpdatesDir = WritePaths.updatesDir
@@ -118,9 +146,22 @@ def __getattr__(attrName: str) -> Any:
 	if not os.path.isdir(storeUpdatesDir):
 		log.debugWarning("Default download path for updates %s could not be created." % storeUpdatesDir)
 
+#: Whether :data:`storeUpdatesDir` is a writable directory, or ``None`` if not yet determined.
+#: Use :func:`_isStoreUpdatesDirWritable` to access this.
+_storeUpdatesDirWritable: bool | None = None
+
+#: The number of seconds for which a successful check that the pending update file exists is trusted.
+_PENDING_UPDATE_FILE_CHECK_TTL_S = 5
+#: The path of the pending update file last found to exist, and when that check expires.
+_pendingUpdateFileCheck: tuple[str, float] | None = None
+
 #: Persistent state information.
 state: Optional[Dict[str, Any]] = None
 
+#: Update checks waiting to be performed in the background, one at a time, by :func:`_performChecks`.
+#: Created by :func:`initialize` and stopped by :func:`terminate`.
+_checkQueue: "queue.SimpleQueue[UpdateChecker | None] | None" = None
+
 #: The single instance of L{AutoUpdateChecker} if automatic update checking is enabled,
 #: C{None} if it is disabled.
 autoChecker: Optional["AutoUpdateChecker"] = None
@@ -140,7 +181,7 @@ class UpdateInfo:
 	"""The API version of the update."""
 
 	launcherHash: str | None = None
-	"""The SHA1 hash of the launcher, if available."""
+	"""The SHA-1 or SHA-256 hash of the launcher as hex, if available."""
 
 	apiCompatTo: str | None = None
 	"""The API version that the update is backward-compatible with, if available."""
@@ -152,29 +193,49 @@ class UpdateInfo:
 	"""URL to download the update from the NV Access website, if available."""
 
 	@classmethod
-	def parseUpdateCheckResponse(cls, data: str) -> Self:
+	@functools.cache
+	def _getKnownKeys(cls) -> frozenset[str]:
+		"""The keys accepted in an update check response, computed once per class."""
+		return frozenset(field.name for field in fields(cls))
+
+	@classmethod
+	@functools.cache
+	def _getRequiredKeys(cls) -> frozenset[str]:
+		"""The keys which must be present in an update check response, computed once per class."""
+		return frozenset(
+			field.name
+			for field in fields(cls)
+			if field.default is MISSING and field.default_factory is MISSING
+		)
+
+	@classmethod
+	def parseUpdateCheckResponse(cls, data: bytes | str) -> Self:
 		"""Parses the update response and returns an UpdateInfo object.
 
-		:param data: The raw server response as a UTF-8 decoded string.
+		:param data: The raw server response.
+			Passing the response as a UTF-8 decoded string is also supported, for backwards compatibility.
 		:return: An UpdateInfo object containing the update metadata.
 		:raises ValueError: If the response format is invalid.
 		"""
-		parameters = inspect.signature(cls).parameters
-		knownKeys: set[str] = set(parameters)
-		requiredKeys: set[str] = {key for key, value in parameters.items() if value.default is value.empty}
+		if isinstance(data, str):
+			data = data.encode("utf-8")
+		knownKeys = cls._getKnownKeys()
 		metadata: dict[str, str] = {}
+		# The response is parsed as bytes,
+		# so that only the values which are kept need to be decoded.
 		for line in data.splitlines():
-			try:
-				key, val = line.split(": ", 1)
-			except ValueError:
-				raise ValueError(f"Invalid line format in update response: {line}")
-			if key in knownKeys:
-				metadata[key] = val
+			key, sep, val = line.partition(b": ")
+			if not sep:
+				raise ValueError(
+					f"Invalid line format in update response: {line.decode('utf-8', errors='replace')}",
+				)
+			keyText = key.decode("utf-8", errors="replace")
+			if keyText in knownKeys:
+				metadata[keyText] = val.decode("utf-8")
 			else:
-				log.debug(f"Dropping unknown key {key} = {val}.")
-		requiredKeys.difference_update(metadata)
-		if len(requiredKeys) > 0:
-			raise ValueError(f"Missing required key(s): {', '.join(requiredKeys)}")
+				log.debug(f"Dropping unknown key {keyText} = {val.decode('utf-8', errors='replace')}.")
+		if missingKeys := cls._getRequiredKeys() - metadata.keys():
+			raise ValueError(f"Missing required key(s): {', '.join(missingKeys)}")
 		return cls(**metadata)
 
 
@@ -184,6 +245,7 @@ def _getCheckURL() -> str:
 	return _DEFAULT_CHECK_URL
 
 
+@functools.lru_cache(maxsize=32)
 def getQualifiedDriverClassNameForStats(cls):
 	"""fetches the name from a given synthDriver or brailleDisplay class, and appends core for in-built code, the add-on name for code from an add-on, or external for code in the NVDA user profile.
 	Some examples:
@@ -191,6 +253,7 @@ def getQualifiedDriverClassNameForStats(cls):
 	newfon (external)
 	eloquence (addon:CodeFactory)
 	noBraille (core)
+	The result is cached per class, as the origin of a loaded driver class cannot change.
 	"""
 	name = cls.name
 	try:
@@ -205,15 +268,11 @@ def getQualifiedDriverClassNameForStats(cls):
 	return "%s (core)" % name
 
 
-def checkForUpdate(auto: bool = False) -> UpdateInfo | None:
-	"""Check for an updated version of NVDA.
-	This will block, so it generally shouldn't be called from the main thread.
+def _computeWinVersionText() -> str:
+	"""Build the description of the Windows version sent with update checks.
 
-	:param auto: Whether this is an automatic check for updates.
-	:return: An UpdateInfo object containing the update metadata, or None if there is no update.
-	:raise RuntimeError: If there is an error checking for an update.
+	:return: The version, service pack and product type; e.g. "10.0.19045 workstation".
 	"""
-	allowUsageStats = config.conf["update"]["allowUsageStats"]
 	# #11837: build version string, service pack, and product type manually
 	# because winVersion.getWinVer adds Windows release name.
 	winVersion = sys.getwindowsversion()
@@ -223,18 +282,47 @@ def checkForUpdate(auto: bool = False) -> UpdateInfo | None:
 		if winVersion.service_pack_minor != 0:
 			winVersionText += ".%d" % winVersion.service_pack_minor
 	winVersionText += " %s" % ("workstation", "domain controller", "server")[winVersion.product_type - 1]
+	return winVersionText
 
+
+#: The Windows version sent with update checks, which cannot change while NVDA is running.
+_WIN_VERSION_TEXT = _computeWinVersionText()
+#: The native processor architecture when running under WOW64, or ``None`` otherwise.
+#: Available values of PROCESSOR_ARCHITEW6432 found in:
+#: https://docs.microsoft.com/en-gb/windows/win32/winprog64/wow64-implementation-details
+_PROCESSOR_ARCHITECTURE: str | None = os.environ.get("PROCESSOR_ARCHITEW6432")
+
+
+@functools.cache
+def _getStaticCheckParams() -> str:
+	"""Get the URL encoded update check parameters which cannot change while NVDA is running.
+
+	:return: The encoded parameters, suitable for inclusion in a query string.
+	"""
+	return urllib.parse.urlencode(
+		{
+			"version": versionInfo.version,
+			"versionType": versionInfo.updateVersionType,
+			"osVersion": _WIN_VERSION_TEXT,
+			# Check if the architecture is the most common: "AMD64"
+			"x64": _PROCESSOR_ARCHITECTURE == "AMD64",
+			"osArchitecture": _PROCESSOR_ARCHITECTURE,
+		},
+	)
+
+
+def checkForUpdate(auto: bool = False) -> UpdateInfo | None:
+	"""Check for an updated version of NVDA.
+	This will block, so it generally shouldn't be called from the main thread.
+
+	:param auto: Whether this is an automatic check for updates.
+	:return: An UpdateInfo object containing the update metadata, or None if there is no update.
+	:raise RuntimeError: If there is an error checking for an update.
+	"""
+	allowUsageStats = config.conf["update"]["allowUsageStats"]
 	params = {
 		"autoCheck": auto,
 		"allowUsageStats": allowUsageStats,
-		"version": versionInfo.version,
-		"versionType": versionInfo.updateVersionType,
-		"osVersion": winVersionText,
-		# Check if the architecture is the most common: "AMD64"
-		# Available values of PROCESSOR_ARCHITEW6432 found in:
-		# https://docs.microsoft.com/en-gb/windows/win32/winprog64/wow64-implementation-details
-		"x64": os.environ.get("PROCESSOR_ARCHITEW6432") == "AMD64",
-		"osArchitecture": os.environ.get("PROCESSOR_ARCHITEW6432"),
 	}
 
 	if auto and allowUsageStats:
@@ -256,17 +344,18 @@ def checkForUpdate(auto: bool = False) -> UpdateInfo | None:
 		}
 		params.update(extraParams)
 
+	checkURL = _getCheckURL()
 	result = _fetchUrlAndUpdateRootCertificates(
-		url=f"{_getCheckURL()}?{urllib.parse.urlencode(params)}",
+		url=f"{checkURL}?{_getStaticCheckParams()}&{urllib.parse.urlencode(params)}",
 		# We must specify versionType so the server doesn't return a 404 error and
 		# thus cause an exception.
-		certFetchUrl=f"{_getCheckURL()}?versionType=stable",
+		certFetchUrl=f"{checkURL}?versionType=stable",
 	)
 
 	if result.status_code != 200:
 		raise RuntimeError(f"Checking for update failed with HTTP status code {result.status_code}.")
 
-	data = result.content.decode("utf-8")  # Ensure the response is decoded correctly
+	data = result.content
 	# if data is empty, we return None, because the server returns an empty response if there is no update.
 	if not data:
 		return None
@@ -287,6 +376,39 @@ def _setStateToNone(_state):
 	_state["pendingUpdateBackCompatToAPIVersion"] = (0, 0, 0)
 
 
+def _isStoreUpdatesDirWritable() -> bool:
+	"""Whether updates can be stored in :data:`storeUpdatesDir`.
+	The result is cached, call :func:`_invalidateStoreUpdatesDirCache` if it may have changed.
+	"""
+	global _storeUpdatesDirWritable
+	if _storeUpdatesDirWritable is None:
+		_storeUpdatesDirWritable = os.path.isdir(storeUpdatesDir) and os.access(storeUpdatesDir, os.W_OK)
+	return _storeUpdatesDirWritable
+
+
+def _invalidateStoreUpdatesDirCache() -> None:
+	global _storeUpdatesDirWritable
+	_storeUpdatesDirWritable = None
+
+
+def _isPendingUpdateFile(path: str) -> bool:
+	"""Whether the pending update file exists.
+	A positive result is cached for :data:`_PENDING_UPDATE_FILE_CHECK_TTL_S` seconds,
+	so that opening several update dialogs in quick succession doesn't repeatedly query the file system.
+	"""
+	global _pendingUpdateFileCheck
+	now = time.monotonic()
+	if _pendingUpdateFileCheck is not None:
+		checkedPath, expiry = _pendingUpdateFileCheck
+		if checkedPath == path and now < expiry:
+			return True
+	if os.path.isfile(path):
+		_pendingUpdateFileCheck = (path, now + _PENDING_UPDATE_FILE_CHECK_TTL_S)
+		return True
+	_pendingUpdateFileCheck = None
+	return False
+
+
 def getPendingUpdate() -> Optional[Tuple]:
 	"""Returns a tuple of the path to and version of the pending update, if any. Returns C{None} otherwise."""
 	try:
@@ -298,7 +420,7 @@ def getPendingUpdate() -> Optional[Tuple]:
 		_setStateToNone(state)
 		return None
 	else:
-		if pendingUpdateFile and os.path.isfile(pendingUpdateFile):
+		if pendingUpdateFile and _isPendingUpdateFile(pendingUpdateFile):
 			return (
 				pendingUpdateFile,
 				pendingUpdateVersion,
@@ -346,26 +468,60 @@ def _generate_updateParameters() -> str:
 	- Whether to disable addons.
 	- The path to the configuration directory.
 
+	:return: The parameters to pass to the new NVDA instance.
+	"""
+	isInstalled = config.isInstalledCopy()
+	portablePath = globalVars.appDir
+	return _buildUpdateParameters(
+		isInstalled=isInstalled,
+		portablePath=portablePath,
+		isPortablePathWritable=not isInstalled and os.access(portablePath, os.W_OK),
+		disableAddons=globalVars.appArgs.disableAddons,
+		configDir=WritePaths.configDir,
+	)
+
+
+@functools.lru_cache(maxsize=8)
+def _buildUpdateParameters(
+	isInstalled: bool,
+	portablePath: str,
+	isPortablePathWritable: bool,
+	disableAddons: bool,
+	configDir: str,
+) -> str:
+	"""Build the command line for the new NVDA instance from the state of this copy of NVDA.
+
+	The result is cached, as there are only a handful of possible combinations of arguments.
+	See :func:`_generate_updateParameters` for the meaning of the generated parameters.
+
 	:return: The parameters to pass to the new NVDA instance.
 	"""
 	executeParams: list[str] = []
-	if config.isInstalledCopy():
+	if isInstalled:
 		executeParams.extend(("--install", "-m"))
+	elif isPortablePathWritable:
+		executeParams.extend(("--create-portable", "-m", "--portable-path", portablePath))
 	else:
-		portablePath = globalVars.appDir
-		if os.access(portablePath, os.W_OK):
-			executeParams.extend(("--create-portable", "-m", "--portable-path", portablePath))
-		else:
-			# We can't write to the currently running portable copy's directory, so just run the launcher.
-			executeParams.append("--launcher")
-	if globalVars.appArgs.disableAddons:
+		# We can't write to the currently running portable copy's directory, so just run the launcher.
+		executeParams.append("--launcher")
+	if disableAddons:
 		executeParams.append("--disable-addons")
 	# pass the config path to the new instance, so that if a custom config path is in use, it will be inherited.
 	# If the default con fig path is in use, the new instance would use it anyway, so there is no harm in passing it.
-	executeParams.extend(("--config-path", WritePaths.configDir))
+	executeParams.extend(("--config-path", configDir))
 	return subprocess.list2cmdline(executeParams)
 
 
+def _getMonthIndex(timestamp: float | None = None) -> int:
+	"""Get a number which uniquely identifies the calendar month of a time, in local time.
+
+	:param timestamp: Seconds since the epoch, or ``None`` for the current time.
+	:return: The number of months between January of year 0 and the month of the given time.
+	"""
+	localTime = time.localtime(timestamp)
+	return localTime.tm_year * 12 + localTime.tm_mon - 1
+
+
 class UpdateChecker(garbageHandler.TrackedObject):
 	"""Check for an updated version of NVDA, presenting appropriate user interface.
 	The check is performed in the background.
@@ -377,19 +533,13 @@ class UpdateChecker(garbageHandler.TrackedObject):
 
 	def check(self):
 		"""Check for an update."""
-		t = threading.Thread(
-			name=f"{self.__class__.__module__}.{self.check.__qualname__}",
-			target=self._bg,
-			daemon=True,
-		)
+		assert _checkQueue is not None
 		self._started()
-		t.start()
+		_checkQueue.put(self)
 
 	def _bg(self):
 		assert state is not None
-		lastCheckDate = datetime.fromtimestamp(state["lastCheck"])
-		nowDate = datetime.now()
-		if (lastCheckDate.year, lastCheckDate.month) != (nowDate.year, nowDate.month):
+		if _getMonthIndex(state["lastCheck"]) != _getMonthIndex():
 			# reset unique ID once a month
 			state["id"] = uuid4().hex
 		try:
@@ -402,7 +552,7 @@ def _bg(self):
 		if info:
 			state["dontRemindVersion"] = info.version
 		state["lastCheck"] = time.time()
-		saveState()
+		_scheduleStateSave()
 		if autoChecker:
 			autoChecker.setNextCheck()
 
@@ -514,7 +664,9 @@ def __init__(self, parent, updateInfo: UpdateInfo | None, auto: bool) -> None:
 		remoteUpdateExists = updateInfo is not None
 		pendingUpdateDetails = getPendingUpdate()
 		canOfferPendingUpdate = (
-			isPendingUpdate() and remoteUpdateExists and pendingUpdateDetails[1] == updateInfo.version
+			pendingUpdateDetails is not None
+			and remoteUpdateExists
+			and pendingUpdateDetails[1] == updateInfo.version
 		)
 
 		text = sHelper.addItem(wx.StaticText(self))
@@ -615,7 +767,7 @@ def _download(self):
 
 	def onLaterButton(self, evt):
 		state["dontRemindVersion"] = None
-		saveState()
+		_scheduleStateSave()
 		self.Close()
 
 	def onReviewAddonsButton(self, evt):
@@ -641,7 +793,7 @@ def __init__(self, parent, destPath, version, apiVersion, backCompatTo):
 		self.version = version
 		self.apiVersion = apiVersion
 		self.backCompatTo = backCompatTo
-		self.storeUpdatesDirWritable = os.path.isdir(storeUpdatesDir) and os.access(storeUpdatesDir, os.W_OK)
+		self.storeUpdatesDirWritable = _isStoreUpdatesDirWritable()
 		# Translators: The title of the dialog asking the user to apply an NVDA update.
 		super().__init__(parent, title=_("NVDA Update"))
 		mainSizer = wx.BoxSizer(wx.VERTICAL)
@@ -751,6 +903,8 @@ def callback(res: int):
 							f"Unable to rename the file from {destPath} to {finalDest}",
 							exc_info=True,
 						)
+						# The updates directory may no longer be writable.
+						_invalidateStoreUpdatesDirCache()
 						gui.messageBox(
 							# Translators: The message when a downloaded update file could not be preserved.
 							_("Unable to postpone update."),
@@ -766,7 +920,7 @@ def callback(res: int):
 					# Postponing an update indicates that the user is likely interested in getting a reminder.
 					# Therefore, clear the dontRemindVersion.
 					state["dontRemindVersion"] = None
-					saveState()
+					_scheduleStateSave()
 
 				case _:
 					log.error(f"Unexpected return code {res} from update dialog")
@@ -780,6 +934,38 @@ def onPostponeButton(self, evt):
 		self.EndModal(wx.ID_CLOSE)
 
 
+def _splitDownload(size: int) -> list[tuple[int, int]]:
+	"""Split an update into segments which can be downloaded over separate connections.
+
+	:param size: The size of the update in bytes.
+	:return: The start and end offsets of each segment, in order.
+	"""
+	connections = min(DOWNLOAD_CONNECTIONS, size // _MIN_DOWNLOAD_SEGMENT_SIZE)
+	if connections <= 1:
+		return [(0, size)]
+	segmentSize = -(-size // connections)  # Round up.
+	return [(start, min(start + segmentSize, size)) for start in range(0, size, segmentSize)]
+
+
+def _interruptResponse(response: http.client.HTTPResponse) -> None:
+	"""Make a read of a response which is blocked in another thread fail straight away.
+	Closing the response isn't enough, as that waits for the lock held by the blocked read.
+	Shutting down the socket makes the read fail without waiting for its timeout.
+
+	:param response: The response to interrupt.
+	"""
+	try:
+		sock = response.fp.raw._sock
+	except AttributeError:
+		# The response has already been closed.
+		return
+	try:
+		sock.shutdown(socket.SHUT_RDWR)
+	except OSError:
+		# The connection has already been closed.
+		pass
+
+
 class UpdateDownloader(garbageHandler.TrackedObject):
 	"""Download and start installation of an updated version of NVDA, presenting appropriate user interface.
 	To use, call L{start} on an instance.
@@ -800,7 +986,22 @@ def __init__(self, updateInfo: UpdateInfo):
 		self.backCompatToAPIVersion = getAPIVersionTupleFromString(updateInfo.apiCompatTo)
 		self.versionTuple = None
 		self.fileHash = updateInfo.launcherHash
+		try:
+			self._expectedHash: bytes | None = bytes.fromhex(self.fileHash) if self.fileHash else None
+		except ValueError:
+			log.error(f"Invalid launcher hash {self.fileHash!r}, the download will fail verification")
+			self._expectedHash = b""
 		self.destPath = _createEmptyTempFileForDeletingFile(prefix="nvda_update_", suffix=".exe")
+		#: The number of bytes downloaded so far over all connections, guarded by ``_downloadProgressLock``.
+		self._downloadedSize = 0
+		#: The download progress last reported to the GUI as a percentage, guarded by ``_downloadProgressLock``.
+		self._downloadReportedPercent = 0
+		self._downloadProgressLock = threading.Lock()
+		#: Set when downloading one segment of the update fails, to stop downloading the others.
+		self._downloadAborted = threading.Event()
+		#: The responses segments are being downloaded from, guarded by ``_downloadProgressLock``.
+		#: These are interrupted when downloading a segment fails.
+		self._downloadResponses: list[http.client.HTTPResponse] = []
 
 	def start(self):
 		"""Start the download."""
@@ -828,11 +1029,16 @@ def start(self):
 		t.start()
 
 	def _guiExec(self, func, *args):
+		# This may be called from a background thread, while _stopped tears down the GUI on the main thread.
+		timer = self._guiExecTimer
+		if timer is None:
+			# The download has been canceled, so there is nothing left to update.
+			return
 		self._guiExecFunc = func
 		self._guiExecArgs = args
-		if not self._guiExecTimer.IsRunning():
+		if not timer.IsRunning():
 			# #6127: Timers must be manipulated from the main thread.
-			wx.CallAfter(self._guiExecTimer.Start, 50, True)
+			wx.CallAfter(timer.Start, 50, True)
 
 	def _guiExecNotify(self):
 		self._guiExecFunc(*self._guiExecArgs)
@@ -860,45 +1066,203 @@ def _bg(self):
 			return
 		self._guiExec(self._downloadSuccess)
 
-	def _download(self, url):
-		# #2352: Some security scanners such as Eset NOD32 HTTP Scanner
-		# cause huge read delays while downloading.
-		# Therefore, set a higher timeout.
-		# The NVDA exe is about 35 MB.
-		# The average download speed in the world is 0.5 MB/s
-		# in some developing countries with the slowest internet.
-		# This yields an expected download time of 10min on slower networks.
-		UPDATE_DOWNLOAD_TIMEOUT = 60 * 30  # 30 min
-		remote = urllib.request.urlopen(url, timeout=UPDATE_DOWNLOAD_TIMEOUT)
-		if remote.code != 200:
-			raise RuntimeError("Download failed with code %d" % remote.code)
-		size = int(remote.headers["content-length"])
-		with open(self.destPath, "wb") as local:
-			if self.fileHash:
-				hasher = hashlib.sha1()
+	def _download(self, url: str, allowSegments: bool = True) -> None:
+		"""Download the update from the given URL to the destination file, and verify it.
+		This returns without raising an error if the download is canceled.
+
+		:param url: The URL to download the update from.
+		:param allowSegments: Whether the update may be downloaded over several connections,
+			if the server supports range requests.
+		:raises RuntimeError: If the download fails or the downloaded file is invalid.
+		"""
+		with urllib.request.urlopen(url, timeout=_DOWNLOAD_TIMEOUT_S) as remote:
+			if remote.code != 200:
+				raise RuntimeError("Download failed with code %d" % remote.code)
+			size = int(remote.headers["content-length"])
+			# Discard any partial download from a previously attempted URL.
+			# Then size the file for the whole update up front,
+			# so that the file system allocates it once rather than on every write.
+			with open(self.destPath, "wb") as local:
+				local.truncate(size)
+			self._downloadedSize = 0
+			self._downloadReportedPercent = 0
+			self._downloadAborted.clear()
+			self._downloadResponses = []
 			self._guiExec(self._downloadReport, 0, size)
-			read = 0
-			chunk = DOWNLOAD_BLOCK_SIZE
+			if allowSegments and remote.headers.get("Accept-Ranges") == "bytes":
+				segments = _splitDownload(size)
+			else:
+				segments = [(0, size)]
+			shouldRetryOverOneConnection = False
+			if len(segments) == 1:
+				self._downloadSegment(remote, 0, size, size)
+			else:
+				try:
+					self._downloadSegments(remote, segments, size)
+				except (OSError, RuntimeError, http.client.HTTPException):
+					# Some servers and proxies advertise range support, but fail range requests.
+					# A connection dropping part way through a range raises http.client.IncompleteRead.
+					log.debugWarning(
+						f"Downloading {url} over several connections failed, retrying over one connection",
+						exc_info=True,
+					)
+					shouldRetryOverOneConnection = True
+		if self._shouldCancel:
+			return
+		if shouldRetryOverOneConnection:
+			self._download(url, allowSegments=False)
+			return
+		if self._expectedHash is not None:
+			algorithm = _LAUNCHER_HASH_ALGORITHMS.get(len(self._expectedHash))
+			if algorithm is None:
+				raise RuntimeError("Launcher hash is not a supported digest")
+			# Hash the completed file in a single C level pass,
+			# rather than feeding each downloaded block to the hasher from Python.
+			# Mapping the file lets the hasher read the cached pages directly, without copying them.
+			hasher = hashlib.new(algorithm)
+			# An empty file can't be mapped.
+			if size:
+				with (
+					open(self.destPath, "rb") as local,
+					mmap.mmap(local.fileno(), 0, access=mmap.ACCESS_READ) as mappedFile,
+				):
+					hasher.update(mappedFile)
+			fileHash = hasher.digest()
+			if not hmac.compare_digest(fileHash, self._expectedHash):
+				raise RuntimeError("Content has incorrect file hash")
+		self._guiExec(self._downloadReport, size, size)
+
+	def _downloadSegments(
+		self,
+		remote: http.client.HTTPResponse,
+		segments: list[tuple[int, int]],
+		size: int,
+	) -> None:
+		"""Download the update over several connections at once, one for each segment.
+
+		:param remote: The response to the initial request for the update, which is used for the first segment.
+		:param segments: The start and end offsets of each segment.
+		:param size: The total size of the update.
+		:raises RuntimeError: If any of the segments could not be downloaded.
+		"""
+		# Range requests are made to the URL the initial request was redirected to, if any.
+		url = remote.geturl()
+		self._trackResponse(remote)
+		firstStart, firstEnd = segments[0]
+		tasks = [(self._downloadSegment, remote, firstStart, firstEnd, size)]
+		tasks.extend((self._downloadRange, url, start, end, size) for start, end in segments[1:])
+		errors: list[BaseException] = []
+		# Daemon threads are used, so that exiting NVDA doesn't wait for a download in progress.
+		threads = [
+			threading.Thread(
+				name=f"{self.__class__.__module__}.{self._downloadSegments.__qualname__}",
+				target=self._runSegmentTask,
+				args=(errors, *task),
+				daemon=True,
+			)
+			for task in tasks
+		]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		if errors:
+			# Segments interrupted after the first failure also report errors, so raise the first.
+			raise errors[0]
+
+	def _runSegmentTask(self, errors: list[BaseException], func: Callable[..., None], *args) -> None:
+		"""Download a segment, stopping the other segments if it fails.
+
+		:param errors: The list the error is appended to if downloading the segment fails.
+		:param func: The function downloading the segment.
+		:param args: The arguments for the function.
+		"""
+		try:
+			func(*args)
+		except BaseException as e:
+			errors.append(e)
+			# Stop downloading the other segments, as the download has failed.
+			with self._downloadProgressLock:
+				self._downloadAborted.set()
+				responses = list(self._downloadResponses)
+			# A segment waiting for data would otherwise only notice once it times out,
+			# which may take up to _DOWNLOAD_TIMEOUT_S.
+			for response in responses:
+				_interruptResponse(response)
+
+	def _trackResponse(self, response: http.client.HTTPResponse) -> None:
+		"""Keep track of a response a segment is downloaded from, so that it can be interrupted.
+		If downloading another segment has already failed, the response is interrupted straight away.
+		"""
+		with self._downloadProgressLock:
+			self._downloadResponses.append(response)
+			isAborted = self._downloadAborted.is_set()
+		if isAborted:
+			_interruptResponse(response)
+
+	def _downloadRange(self, url: str, start: int, end: int, size: int) -> None:
+		"""Download one segment of the update with an HTTP range request.
+
+		:param url: The URL of the update.
+		:param start: The offset of the first byte of the segment.
+		:param end: The offset just past the last byte of the segment.
+		:param size: The total size of the update.
+		:raises RuntimeError: If the server does not return the requested range.
+		"""
+		request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end - 1}"})
+		with urllib.request.urlopen(request, timeout=_DOWNLOAD_TIMEOUT_S) as remote:
+			self._trackResponse(remote)
+			if remote.code != 206:
+				raise RuntimeError("Range request failed with code %d" % remote.code)
+			contentRange = remote.headers.get("Content-Range", "")
+			if not contentRange.startswith(f"bytes {start}-{end - 1}/"):
+				raise RuntimeError(f"Unexpected content range {contentRange!r}")
+			self._downloadSegment(remote, start, end, size)
+
+	def _downloadSegment(self, remote: http.client.HTTPResponse, start: int, end: int, size: int) -> None:
+		"""Write the bytes of the update between two offsets from a response to the destination file.
+
+		:param remote: The response whose body starts at the start offset.
+		:param start: The offset of the first byte to write.
+		:param end: The offset just past the last byte to write.
+		:param size: The total size of the update.
+		:raises RuntimeError: If the response ends before the end offset.
+		"""
+		# Blocks are already written in large chunks, so skip the extra copy through a write buffer.
+		with open(self.destPath, "r+b", buffering=0) as local:
+			local.seek(start)
+			position = start
+			# Receive each block into the same buffer, rather than allocating a new bytes object for each.
+			buffer = memoryview(bytearray(DOWNLOAD_BLOCK_SIZE))
 			while True:
-				if self._shouldCancel:
+				if self._shouldCancel or self._downloadAborted.is_set():
 					return
-				if size - read < chunk:
-					chunk = size - read
-				block = remote.read(chunk)
-				if not block:
+				# Slicing limits the read to the end of the segment.
+				# This matters for the first segment, whose response continues into the next.
+				blockSize = remote.readinto(buffer[: end - position])
+				if not blockSize:
 					break
-				read += len(block)
-				if self._shouldCancel:
+				position += blockSize
+				# Check again, as the download may have been canceled while waiting for the block.
+				# Once canceled, the GUI has been torn down, so no further progress can be reported.
+				if self._shouldCancel or self._downloadAborted.is_set():
 					return
-				local.write(block)
-				if self.fileHash:
-					hasher.update(block)
-				self._guiExec(self._downloadReport, read, size)
-			if read < size:
-				raise RuntimeError("Content too short")
-			if self.fileHash and hasher.hexdigest() != self.fileHash:
-				raise RuntimeError("Content has incorrect file hash")
-		self._guiExec(self._downloadReport, read, size)
+				block = buffer[:blockSize]
+				while block:
+					# Unbuffered writes may write less than requested.
+					block = block[local.write(block) :]
+				with self._downloadProgressLock:
+					self._downloadedSize += blockSize
+					# The progress dialog only shows whole percentages,
+					# so only report progress to the GUI when the percentage changes.
+					percent = self._downloadedSize * 100 // size
+					if percent > self._downloadReportedPercent:
+						self._downloadReportedPercent = percent
+						# Report while holding the lock,
+						# so that reports from different connections reach the GUI in order.
+						self._guiExec(self._downloadReport, self._downloadedSize, size)
+		if position < end:
+			raise RuntimeError("Content too short")
 
 	def _downloadReport(self, read, size):
 		if self._shouldCancel:
@@ -995,32 +1359,168 @@ def onClose(self, evt):
 		self.Destroy()
 
 
+#: The delay in milliseconds before changes to the state are written to disk.
+#: Changes made within this delay are coalesced into a single write.
+_STATE_SAVE_DELAY_MS = 500
+#: Whether the state has changed since it was last written, guarded by :data:`_stateSaveLock`.
+_isStateDirty = False
+_stateSaveLock = threading.Lock()
+
+#: State keys holding add-on API version tuples, which JSON stores as lists.
+_STATE_API_VERSION_KEYS = ("pendingUpdateAPIVersion", "pendingUpdateBackCompatToAPIVersion")
+
+
 def saveState():
 	try:
-		# #9038: Python 3 requires binary format when working with pickles.
-		with open(WritePaths.updateCheckStateFile, "wb") as f:
-			pickle.dump(state, f, protocol=0)
+		# Replace the state file only once it has been fully written,
+		# so that an interrupted save can't lose the state, including the user ID.
+		with FaultTolerantFile(WritePaths.updateCheckStateFile) as f:
+			f.write(json.dumps(state).encode("utf-8"))
 	except:  # noqa: E722
 		log.debugWarning("Error saving state", exc_info=True)
 
 
+def _scheduleStateSave() -> None:
+	"""Write the state to disk shortly, coalescing changes made in quick succession into one write.
+	This function can be safely called from any thread.
+	Use :func:`saveState` instead where the state must be on disk before returning.
+	"""
+	global _isStateDirty
+	with _stateSaveLock:
+		if _isStateDirty:
+			# A save is already scheduled, which will include this change.
+			return
+		_isStateDirty = True
+	try:
+		core.callLater(_STATE_SAVE_DELAY_MS, _flushState)
+	except Exception:
+		# For example, core.NVDANotInitializedError if wx isn't running.
+		# Write the state now, which also clears the dirty flag,
+		# as otherwise no later change would ever schedule a save.
+		log.debugWarning("Couldn't schedule saving the update state, saving it now", exc_info=True)
+		_flushState()
+
+
+def _flushState() -> None:
+	"""Write the state to disk if a save has been scheduled and not yet performed."""
+	global _isStateDirty
+	with _stateSaveLock:
+		if not _isStateDirty:
+			return
+		_isStateDirty = False
+	if state is None:
+		# The update checker has been terminated since the save was scheduled.
+		return
+	saveState()
+
+
+class _LegacyStateUnpickler(pickle.Unpickler):
+	"""Unpickles the state saved by older versions of NVDA.
+	That state only holds dictionaries, tuples, strings, numbers and ``None``,
+	none of which need a global to be looked up.
+	Refusing to look up globals means a tampered state file can't run code when it is loaded.
+	"""
+
+	def find_class(self, module: str, name: str) -> Any:
+		raise pickle.UnpicklingError(f"Refusing to load {module}.{name} from the update state")
+
+
+def _loadState() -> dict[str, Any]:
+	"""Load the persisted update check state.
+
+	Older versions of NVDA pickled the state.
+	Such state is still read, and is written back as JSON the next time the state is saved.
+	Only built-in values are unpickled, see :class:`_LegacyStateUnpickler`.
+
+	:return: The loaded state.
+	:raises ValueError: If the state is not a dictionary.
+	:raises pickle.UnpicklingError: If legacy state refers to any global, such as a class or function.
+	"""
+	with open(WritePaths.updateCheckStateFile, "rb") as f:
+		data = f.read()
+	try:
+		loadedState = json.loads(data)
+	except ValueError:
+		log.debug("Update state is not JSON, migrating from pickle")
+		loadedState = _LegacyStateUnpickler(io.BytesIO(data)).load()
+	if not isinstance(loadedState, dict):
+		raise ValueError(f"Unexpected update state type {type(loadedState)}")
+	for key in _STATE_API_VERSION_KEYS:
+		if isinstance(loadedState.get(key), list):
+			loadedState[key] = tuple(loadedState[key])
+	return loadedState
+
+
+#: The maximum number of stale update files removed at once.
+_STALE_UPDATE_FILE_REMOVAL_WORKERS = 4
+
+
+def _removeStaleUpdateFiles() -> None:
+	"""Remove all update files except the one that is currently pending (if any)."""
+	pendingUpdateFile = state.get("pendingUpdateFile")
+	try:
+		with os.scandir(storeUpdatesDir) as entries:
+			staleFiles = [entry.path for entry in entries if entry.path != pendingUpdateFile]
+	except OSError:
+		log.warning("Unable to list old update files in %s" % storeUpdatesDir, exc_info=True)
+		return
+	if len(staleFiles) <= 1:
+		for staleFile in staleFiles:
+			_removeStaleUpdateFile(staleFile)
+		return
+	# Anti-virus software may scan each file as it is removed, which can be slow for large update files.
+	# Removing several files at once lets these scans overlap.
+	with ThreadPoolExecutor(
+		max_workers=min(len(staleFiles), _STALE_UPDATE_FILE_REMOVAL_WORKERS),
+		thread_name_prefix=f"{__name__}.{_removeStaleUpdateFiles.__qualname__}",
+	) as executor:
+		executor.map(_removeStaleUpdateFile, staleFiles)
+
+
+def _removeStaleUpdateFile(path: str) -> None:
+	try:
+		os.remove(path)
+	except OSError:
+		log.warning("Unable to remove old update file %s" % path, exc_info=True)
+	else:
+		log.debug("Update file %s removed" % path)
+
+
+def _performChecks(checks: "queue.SimpleQueue[UpdateChecker | None]") -> None:
+	"""Perform update checks in the order they were queued, until ``None`` is received.
+	Checks queued before ``None`` are still performed,
+	so that the progress dialog of every started manual check is closed.
+
+	:param checks: The queue of checks to perform.
+	"""
+	while (checker := checks.get()) is not None:
+		try:
+			checker._bg()
+		except Exception:
+			log.error("Unhandled error in update check", exc_info=True)
+
+
 def initialize():
-	global state, autoChecker
+	global state, autoChecker, _checkQueue
+	_checkQueue = queue.SimpleQueue()
+	# A daemon thread is used so that exiting NVDA doesn't wait for a check which is in progress.
+	threading.Thread(
+		name=f"{__name__}.{_performChecks.__qualname__}",
+		target=_performChecks,
+		args=(_checkQueue,),
+		daemon=True,
+	).start()
+	_invalidateStoreUpdatesDirCache()
 	try:
-		# #9038: Python 3 requires binary format when working with pickles.
-		with open(WritePaths.updateCheckStateFile, "rb") as f:
-			state = pickle.load(f)
+		state = _loadState()
 	except:  # noqa: E722
 		log.debugWarning("Couldn't retrieve update state", exc_info=True)
-		state = None
-
-	if state is None:
 		# Defaults.
+		# The pending update keys are filled in below.
 		state = {
 			"lastCheck": 0,
 			"dontRemindVersion": None,
 		}
-		_setStateToNone(state)
 
 	if "id" not in state:
 		# ID was introduced in 2024.3
@@ -1028,17 +1528,9 @@ def initialize():
 
 	# check the pending version against the current version
 	# and make sure that pendingUpdateFile and pendingUpdateVersion are part of the state dictionary.
-	if "pendingUpdateVersion" not in state or state["pendingUpdateVersion"] == versionInfo.version:
+	if state.get("pendingUpdateVersion") in (None, versionInfo.version):
 		_setStateToNone(state)
-	# remove all update files except the one that is currently pending (if any)
-	try:
-		for fileName in os.listdir(storeUpdatesDir):
-			f = os.path.join(storeUpdatesDir, fileName)
-			if f != state["pendingUpdateFile"]:
-				os.remove(f)
-				log.debug("Update file %s removed" % f)
-	except OSError:
-		log.warning("Unable to remove old update file %s" % f, exc_info=True)
+	_removeStaleUpdateFiles()
 
 	if not globalVars.appArgs.launcher and (
 		config.conf["update"]["autoCheck"]
@@ -1048,8 +1540,12 @@ def initialize():
 
 
 def terminate():
-	global state, autoChecker
+	global state, autoChecker, _checkQueue
+	_flushState()
 	state = None
 	if autoChecker:
 		autoChecker.terminate()
 		autoChecker = None
+	if _checkQueue:
+		_checkQueue.put(None)
+		_checkQueue = None
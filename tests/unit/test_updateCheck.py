@@ -0,0 +1,237 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for the updateCheck module."""
+
+import io
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import versionInfo
+
+# Update checking isn't supported by builds without an update version type, such as source copies.
+with patch.object(versionInfo, "updateVersionType", "stable"):
+	import updateCheck
+
+
+class Test_state(unittest.TestCase):
+	"""Tests for saving and loading the persisted update check state."""
+
+	def setUp(self) -> None:
+		self._tempDir = tempfile.TemporaryDirectory()
+		self.addCleanup(self._tempDir.cleanup)
+		self._stateFile = os.path.join(self._tempDir.name, "updateCheckState.pickle")
+		writePathsPatcher = patch("updateCheck.WritePaths", MagicMock(updateCheckStateFile=self._stateFile))
+		writePathsPatcher.start()
+		self.addCleanup(writePathsPatcher.stop)
+
+	def _writeLegacyState(self, legacyState: object) -> None:
+		# Older versions of NVDA pickled the state with the default protocol of Python 2, protocol 0.
+		with open(self._stateFile, "wb") as f:
+			f.write(pickle.dumps(legacyState, protocol=0))
+
+	def test_jsonRoundTrip(self):
+		savedState = {
+			"id": "0123456789abcdef0123456789abcdef",
+			"lastCheck": 1700000000.5,
+			"dontRemindVersion": None,
+			"pendingUpdateFile": "C:\\updates\\nvda_update.exe",
+			"pendingUpdateVersion": "2025.1",
+			"pendingUpdateAPIVersion": (2025, 1, 0),
+			"pendingUpdateBackCompatToAPIVersion": (2025, 1, 0),
+		}
+		with patch.object(updateCheck, "state", savedState):
+			updateCheck.saveState()
+		with open(self._stateFile, "rb") as f:
+			self.assertEqual(f.read(1), b"{")
+		self.assertEqual(updateCheck._loadState(), savedState)
+
+	def test_migratesProtocol0Pickle(self):
+		legacyState = {
+			"lastCheck": 1700000000.5,
+			"dontRemindVersion": "2024.4",
+			"pendingUpdateFile": None,
+			"pendingUpdateVersion": None,
+			"pendingUpdateAPIVersion": (2024, 1, 0),
+			"pendingUpdateBackCompatToAPIVersion": (2023, 1, 0),
+		}
+		self._writeLegacyState(legacyState)
+		loadedState = updateCheck._loadState()
+		self.assertEqual(loadedState, legacyState)
+		# Save the migrated state as JSON, and check it loads back the same, including the API version tuples.
+		with patch.object(updateCheck, "state", loadedState):
+			updateCheck.saveState()
+		migratedState = updateCheck._loadState()
+		self.assertEqual(migratedState, legacyState)
+		for key in updateCheck._STATE_API_VERSION_KEYS:
+			self.assertIsInstance(migratedState[key], tuple)
+
+	def test_legacyPickleWithGlobalIsRefused(self):
+		self._writeLegacyState({"lastCheck": 0, "dontRemindVersion": print})
+		with self.assertRaises(pickle.UnpicklingError):
+			updateCheck._loadState()
+
+	def test_stateWhichIsNotADictIsRefused(self):
+		self._writeLegacyState([0, None])
+		with self.assertRaises(ValueError):
+			updateCheck._loadState()
+
+
+class Test_UpdateInfo_parseUpdateCheckResponse(unittest.TestCase):
+	"""Tests for parsing the response of the update server."""
+
+	_RESPONSE = (
+		b"version: 2025.1\n"
+		b"launcherUrl: https://example.com/nvda_2025.1.exe\n"
+		b"apiVersion: 2025.1.0\n"
+		b"launcherHash: 0123456789abcdef0123456789abcdef01234567\n"
+	)
+
+	def _assertExpectedInfo(self, info: updateCheck.UpdateInfo) -> None:
+		self.assertEqual(info.version, "2025.1")
+		self.assertEqual(info.launcherUrl, "https://example.com/nvda_2025.1.exe")
+		self.assertEqual(info.apiVersion, "2025.1.0")
+		self.assertEqual(info.launcherHash, "0123456789abcdef0123456789abcdef01234567")
+		self.assertIsNone(info.apiCompatTo)
+
+	def test_bytes(self):
+		self._assertExpectedInfo(updateCheck.UpdateInfo.parseUpdateCheckResponse(self._RESPONSE))
+
+	def test_str(self):
+		info = updateCheck.UpdateInfo.parseUpdateCheckResponse(self._RESPONSE.decode("utf-8"))
+		self._assertExpectedInfo(info)
+
+	def test_crlfLineEndings(self):
+		response = self._RESPONSE.replace(b"\n", b"\r\n")
+		self._assertExpectedInfo(updateCheck.UpdateInfo.parseUpdateCheckResponse(response))
+
+	def test_unknownKeyIsDropped(self):
+		response = self._RESPONSE + b"futureKey: value\n"
+		self._assertExpectedInfo(updateCheck.UpdateInfo.parseUpdateCheckResponse(response))
+
+	def test_nonAsciiValue(self):
+		response = self._RESPONSE.replace(b"2025.1\n", "2025.1 bêta\n".encode("utf-8"), 1)
+		info = updateCheck.UpdateInfo.parseUpdateCheckResponse(response)
+		self.assertEqual(info.version, "2025.1 bêta")
+
+	def test_missingSeparator(self):
+		with self.assertRaises(ValueError):
+			updateCheck.UpdateInfo.parseUpdateCheckResponse(self._RESPONSE + b"invalidLine\n")
+
+	def test_missingRequiredKey(self):
+		response = self._RESPONSE.replace(b"apiVersion: 2025.1.0\n", b"")
+		with self.assertRaisesRegex(ValueError, "apiVersion"):
+			updateCheck.UpdateInfo.parseUpdateCheckResponse(response)
+
+	def test_invalidUtf8(self):
+		response = self._RESPONSE.replace(b"2025.1\n", b"2025.1\xff\n", 1)
+		# checkForUpdate relies on invalid responses raising ValueError.
+		with self.assertRaises(ValueError):
+			updateCheck.UpdateInfo.parseUpdateCheckResponse(response)
+
+
+class Test_splitDownload(unittest.TestCase):
+	"""Tests for splitting an update into segments downloaded over separate connections."""
+
+	def _assertSegmentsCover(self, segments: list[tuple[int, int]], size: int) -> None:
+		self.assertEqual(segments[0][0], 0)
+		self.assertEqual(segments[-1][1], size)
+		for (_start, end), (nextStart, _nextEnd) in zip(segments, segments[1:]):
+			self.assertEqual(end, nextStart)
+
+	def test_empty(self):
+		self.assertEqual(updateCheck._splitDownload(0), [(0, 0)])
+
+	def test_belowTwoSegments(self):
+		size = 2 * updateCheck._MIN_DOWNLOAD_SEGMENT_SIZE - 1
+		self.assertEqual(updateCheck._splitDownload(size), [(0, size)])
+
+	def test_exactlyTwoSegments(self):
+		segmentSize = updateCheck._MIN_DOWNLOAD_SEGMENT_SIZE
+		self.assertEqual(
+			updateCheck._splitDownload(2 * segmentSize),
+			[(0, segmentSize), (segmentSize, 2 * segmentSize)],
+		)
+
+	def test_typicalLauncher(self):
+		size = 35_000_000
+		segments = updateCheck._splitDownload(size)
+		self.assertEqual(len(segments), updateCheck.DOWNLOAD_CONNECTIONS)
+		self._assertSegmentsCover(segments, size)
+		for start, end in segments:
+			self.assertGreaterEqual(end - start, updateCheck._MIN_DOWNLOAD_SEGMENT_SIZE)
+
+
+class _FakeResponse(io.BytesIO):
+	"""A response to an HTTP request, with its body held in memory."""
+
+	def __init__(self, body: bytes, code: int, headers: dict[str, str]):
+		super().__init__(body)
+		self.code = code
+		self.headers = headers
+
+
+class Test_UpdateDownloader_downloadRange(unittest.TestCase):
+	"""Tests for downloading a segment of an update with an HTTP range request."""
+
+	_UPDATE = bytes(range(16))
+	_URL = "https://example.com/nvda_2025.1.exe"
+
+	def setUp(self) -> None:
+		info = updateCheck.UpdateInfo(
+			version="2025.1",
+			launcherUrl=self._URL,
+			apiVersion="2025.1.0",
+			apiCompatTo="2025.1.0",
+		)
+		self._downloader = updateCheck.UpdateDownloader(info)
+		self.addCleanup(os.remove, self._downloader.destPath)
+		self._downloader._shouldCancel = False
+		with open(self._downloader.destPath, "wb") as local:
+			local.truncate(len(self._UPDATE))
+		guiExecPatcher = patch.object(self._downloader, "_guiExec")
+		guiExecPatcher.start()
+		self.addCleanup(guiExecPatcher.stop)
+
+	def _downloadRange(self, response: _FakeResponse, start: int, end: int) -> MagicMock:
+		with patch("urllib.request.urlopen", return_value=response) as urlopen:
+			self._downloader._downloadRange(self._URL, start, end, len(self._UPDATE))
+		return urlopen
+
+	def _readDownload(self) -> bytes:
+		with open(self._downloader.destPath, "rb") as local:
+			return local.read()
+
+	def test_partialContent(self):
+		response = _FakeResponse(self._UPDATE[4:8], 206, {"Content-Range": "bytes 4-7/16"})
+		urlopen = self._downloadRange(response, 4, 8)
+		request = urlopen.call_args.args[0]
+		self.assertEqual(request.get_header("Range"), "bytes=4-7")
+		self.assertEqual(self._readDownload(), bytes(4) + self._UPDATE[4:8] + bytes(8))
+
+	def test_fullContentIsRefused(self):
+		response = _FakeResponse(self._UPDATE, 200, {})
+		with self.assertRaises(RuntimeError):
+			self._downloadRange(response, 4, 8)
+		self.assertEqual(self._readDownload(), bytes(16))
+
+	def test_unexpectedContentRangeIsRefused(self):
+		response = _FakeResponse(self._UPDATE[0:4], 206, {"Content-Range": "bytes 0-3/16"})
+		with self.assertRaises(RuntimeError):
+			self._downloadRange(response, 4, 8)
+		self.assertEqual(self._readDownload(), bytes(16))
+
+	def test_missingContentRangeIsRefused(self):
+		response = _FakeResponse(self._UPDATE[4:8], 206, {})
+		with self.assertRaises(RuntimeError):
+			self._downloadRange(response, 4, 8)
+
+	def test_shortContentIsRefused(self):
+		response = _FakeResponse(self._UPDATE[4:6], 206, {"Content-Range": "bytes 4-7/16"})
+		with self.assertRaisesRegex(RuntimeError, "too short"):
+			self._downloadRange(response, 4, 8)